@@ -1,11 +1,13 @@
 import logging
 from dataclasses import dataclass, field
-from typing import List, Protocol, runtime_checkable, Optional
+from typing import Any, Dict, List, Protocol, runtime_checkable, Optional
 from pathlib import Path
 
+import numpy as np
+
 
 # Data models
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SpeakerSegment:
     start: float  # seconds
     end: float  # seconds
@@ -13,12 +15,12 @@ class SpeakerSegment:
     text: Optional[str] = None  # Optionally attach transcript text
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiarizationResult:
     segments: List[SpeakerSegment] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiarizedSegment:
     start: float
     end: float
@@ -26,7 +28,7 @@ class DiarizedSegment:
     text: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DiarizedTranscript:
     segments: List[DiarizedSegment] = field(default_factory=list)
     full_text: str = ""
@@ -41,6 +43,10 @@ class DiarizationBackend(Protocol):
 
 
 # Pyannote implementation
+# Loaded pipelines shared by every backend instance, keyed by pipeline name
+_PIPELINE_CACHE: Dict[str, Any] = {}
+
+
 class PyannoteDiarizationBackend:
     def __init__(
         self,
@@ -49,11 +55,13 @@ class PyannoteDiarizationBackend:
     ):
         self._logger = logging.getLogger(__name__)
         self._logger.info(f"Initializing Pyannote Diarization Backend: {pipeline_name}")
-        from pyannote.audio import Pipeline
+        self.pipeline = _PIPELINE_CACHE.get(pipeline_name)
+        if self.pipeline is None:
+            from pyannote.audio import Pipeline
 
-        self.pipeline = Pipeline.from_pretrained(
-            pipeline_name, use_auth_token=access_token
-        )
+            self.pipeline = _PIPELINE_CACHE[pipeline_name] = Pipeline.from_pretrained(
+                pipeline_name, use_auth_token=access_token
+            )
         self._logger.info("Pyannote Diarization Backend initialized.")
 
     def diarize(self, audio_path: Path) -> DiarizationResult:
@@ -71,27 +79,44 @@ class PyannoteDiarizationBackend:
 class DiarizedTranscriptBuilder:
     @staticmethod
     def merge(transcript, diarization_result) -> DiarizedTranscript:
-        # Align transcript segments to diarization segments by time overlap
+        # Align transcript segments to diarization segments by time overlap.
+        # The transcript's sorted time arrays let the overlapping slice for
+        # every speaker segment be found with binary search.
+        starts, ends, texts = transcript.starts, transcript.ends, transcript.texts
+        if len(starts) > 1 and np.any(starts[1:] < starts[:-1]):
+            order = np.argsort(starts, kind="stable")
+            starts, ends = starts[order], ends[order]
+            texts = [texts[i] for i in order.tolist()]
+        # Running max of end times keeps the array sorted, so everything
+        # before `lo` has ended by the speaker start even with nested segments.
+        max_ends = np.maximum.accumulate(ends) if len(ends) else ends
+        speaker_segments = diarization_result.segments
+        speaker_starts = np.fromiter(
+            (sp.start for sp in speaker_segments), dtype=np.float64
+        )
+        speaker_ends = np.fromiter(
+            (sp.end for sp in speaker_segments), dtype=np.float64
+        )
+        los = np.searchsorted(max_ends, speaker_starts, side="right")
+        his = np.searchsorted(starts, speaker_ends, side="left")
         diarized_segments = []
-        for speaker_segment in diarization_result.segments:
-            # Collect transcript segments that overlap with this speaker segment
-            texts = []
-            for tseg in transcript.segments:
-                # Check for time overlap
-                if (
-                    tseg.end > speaker_segment.start
-                    and tseg.start < speaker_segment.end
-                ):
-                    # Optionally, trim text to the overlap
-                    texts.append(tseg.text)
-            if texts:
-                diarized_segments.append(
-                    DiarizedSegment(
-                        start=speaker_segment.start,
-                        end=speaker_segment.end,
-                        speaker=speaker_segment.speaker,
-                        text=" ".join(texts),
-                    )
+        bounds = zip(speaker_segments, los.tolist(), his.tolist())
+        for speaker_segment, lo, hi in bounds:
+            if lo >= hi:
+                continue
+            # Transcript segments straddling a boundary belong to both sides
+            overlapping = ends[lo:hi] > speaker_segment.start
+            if overlapping.all():
+                segment_texts = texts[lo:hi]
+            else:
+                segment_texts = [texts[lo + k] for k in np.flatnonzero(overlapping)]
+            diarized_segments.append(
+                DiarizedSegment(
+                    start=speaker_segment.start,
+                    end=speaker_segment.end,
+                    speaker=speaker_segment.speaker,
+                    text=" ".join(segment_texts),
                 )
+            )
         full_text = transcript.full_text
         return DiarizedTranscript(segments=diarized_segments, full_text=full_text)
@@ -1,5 +1,9 @@
+from functools import lru_cache
 from typing import Optional
 
+# A prefix this long is plenty for langdetect and bounds the work on long transcripts
+_DETECTION_PREFIX_CHARS = 1024
+
 
 class LanguageDetector:
     def __init__(self):
@@ -9,10 +13,11 @@ class LanguageDetector:
             self._detect = detect
         except ImportError:
             raise ImportError("Please install langdetect: pip install langdetect")
+        self._detect_cached = lru_cache(maxsize=256)(self._detect)
 
     def detect_language(self, text: str) -> Optional[str]:
         try:
-            lang = self._detect(text)
+            lang = self._detect_cached(text[:_DETECTION_PREFIX_CHARS])
             return lang
         except Exception:
             return None
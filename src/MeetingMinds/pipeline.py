@@ -1,4 +1,5 @@
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Optional
 
@@ -29,18 +30,30 @@ class MeetingPipeline:
             access_token=""
         )
         # self.summarizer = summarizer  # Uncomment when available
+        self._lang_detector = LanguageDetector()
+        # One Cleaner per language, reused across runs
+        self._cleaners: dict[str, Cleaner] = {}
 
     def run(self, audio_path: Path):
         self.logger.info(f"Starting pipeline for {audio_path}")
-        # 1. Transcription
+        # 1-2. Transcription and diarization are independent, run them together
+        executor = ThreadPoolExecutor(max_workers=2)
         try:
-            transcript: Transcript = self.transcriber.transcribe(audio_path)
-            self.logger.info("Transcription completed.")
-        except TranscriptionError as e:
-            self.logger.error(f"Transcription failed: {e}")
-            raise
-        # 2. Diarization
-        diarization_result: DiarizationResult = self.diarizer.diarize(audio_path)
+            transcript_future = executor.submit(
+                self.transcriber.transcribe, audio_path
+            )
+            diarization_future = executor.submit(self.diarizer.diarize, audio_path)
+            try:
+                transcript: Transcript = transcript_future.result()
+                self.logger.info("Transcription completed.")
+            except TranscriptionError as e:
+                self.logger.error(f"Transcription failed: {e}")
+                raise
+            diarization_result: DiarizationResult = diarization_future.result()
+        finally:
+            # Never block here: on any error it is reported right away and a
+            # step that is still running finishes in the background.
+            executor.shutdown(wait=False, cancel_futures=True)
         self.logger.info("Diarization completed.")
         # 3. Merge transcript and diarization
         diarized_transcript: DiarizedTranscript = DiarizedTranscriptBuilder.merge(
@@ -48,14 +61,13 @@ class MeetingPipeline:
         )
         self.logger.info("Diarized transcript built.")
         # 4. Detect language
-        language_detector = LanguageDetector()
-        detected_language = language_detector.detect_language(
+        detected_language = self._lang_detector.detect_language(
             diarized_transcript.full_text
         )
         self.logger.info(f"Detected language: {detected_language}")
         # 5. Clean transcript
-        cleaner = Cleaner(
-            language=detected_language if detected_language in ["en", "es"] else "en"
+        cleaner = self._get_cleaner(
+            detected_language if detected_language in ["en", "es"] else "en"
         )
         cleaned_diarized_transcript = cleaner.clean_diarized_transcript(
             diarized_transcript
@@ -76,6 +88,12 @@ class MeetingPipeline:
             # "summary": summary,
         }
 
+    def _get_cleaner(self, language: str) -> Cleaner:
+        cleaner = self._cleaners.get(language)
+        if cleaner is None:
+            cleaner = self._cleaners[language] = Cleaner(language=language)
+        return cleaner
+
 
 if __name__ == "__main__":
     import sys
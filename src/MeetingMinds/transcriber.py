@@ -1,8 +1,10 @@
 import logging
 from dataclasses import dataclass, field
-from typing import List, Protocol, runtime_checkable
+from typing import Any, Dict, List, Optional, Protocol, Tuple, runtime_checkable
 from pathlib import Path
 
+import numpy as np
+
 
 # Error hierarchy
 class TranscriptionError(Exception):
@@ -10,7 +12,7 @@ class TranscriptionError(Exception):
 
 
 class AudioFormatError(TranscriptionError):
-    """Raised when audio format conversion fails."""
+    """Raised when the input audio cannot be read."""
 
 
 class ModelLoadError(TranscriptionError):
@@ -22,18 +24,62 @@ class BackendError(TranscriptionError):
 
 
 # Data models
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TranscriptSegment:
     start: float  # seconds
     end: float  # seconds
     text: str
 
 
-@dataclass(frozen=True)
+# Stored column-wise (starts/ends/texts) so the merge step can binary-search the
+# time bounds without building a TranscriptSegment per Whisper segment.
+@dataclass(frozen=True, eq=False, slots=True)
 class Transcript:
-    segments: List[TranscriptSegment] = field(default_factory=list)
+    starts: np.ndarray = field(default_factory=lambda: np.empty(0))  # seconds
+    ends: np.ndarray = field(default_factory=lambda: np.empty(0))  # seconds
+    texts: List[str] = field(default_factory=list)
     full_text: str = ""
 
+    def __post_init__(self):
+        starts = np.array(self.starts, dtype=np.float64)
+        ends = np.array(self.ends, dtype=np.float64)
+        if not (len(starts) == len(ends) == len(self.texts)):
+            raise ValueError("starts, ends and texts must have the same length")
+        starts.setflags(write=False)
+        ends.setflags(write=False)
+        object.__setattr__(self, "starts", starts)
+        object.__setattr__(self, "ends", ends)
+
+    @classmethod
+    def from_segments(
+        cls, segments: List[TranscriptSegment], full_text: str = ""
+    ) -> "Transcript":
+        return cls(
+            starts=[seg.start for seg in segments],
+            ends=[seg.end for seg in segments],
+            texts=[seg.text for seg in segments],
+            full_text=full_text,
+        )
+
+    @property
+    def segments(self) -> List[TranscriptSegment]:
+        return [
+            TranscriptSegment(start=start, end=end, text=text)
+            for start, end, text in zip(
+                self.starts.tolist(), self.ends.tolist(), self.texts
+            )
+        ]
+
+    def __eq__(self, other):
+        if not isinstance(other, Transcript):
+            return NotImplemented
+        return (
+            self.texts == other.texts
+            and self.full_text == other.full_text
+            and np.array_equal(self.starts, other.starts)
+            and np.array_equal(self.ends, other.ends)
+        )
+
 
 # Backend interface
 @runtime_checkable
@@ -41,7 +87,72 @@ class TranscriptionBackend(Protocol):
     def transcribe(self, audio_path: Path) -> Transcript: ...
 
 
+def _check_audio(audio_path: Path) -> None:
+    # Backends decode any ffmpeg-readable format themselves, so the file is
+    # passed through as-is; only make sure it exists before loading a model.
+    if not audio_path.is_file():
+        logging.getLogger(__name__).error(f"Audio file not found: {audio_path}")
+        raise AudioFormatError(f"Audio file not found: {audio_path}")
+
+
+def _split_timestamped(
+    tokens: List[int], tokenizer, duration: float, time_precision: float
+) -> Transcript:
+    # Split one decoded window at its timestamp tokens, the way whisper's
+    # transcribe() builds segments: each pair of consecutive timestamp tokens
+    # closes a segment spanning from its first to its last timestamp.
+    timestamp_begin = tokenizer.timestamp_begin
+    is_timestamp = [token >= timestamp_begin for token in tokens]
+    slices = [
+        i + 1
+        for i in range(len(tokens) - 1)
+        if is_timestamp[i] and is_timestamp[i + 1]
+    ]
+    spans = []  # (start, end, tokens)
+    if slices:
+        # Tokens after the last pair: whisper would re-decode them in the next
+        # window, but the clip ends here, so they form a final segment.
+        slices.append(len(tokens))
+        last_slice = 0
+        for current_slice in slices:
+            sliced = tokens[last_slice:current_slice]
+            start = (sliced[0] - timestamp_begin) * time_precision
+            if sliced[-1] >= timestamp_begin:
+                end = (sliced[-1] - timestamp_begin) * time_precision
+            else:
+                end = duration
+            spans.append((start, end, sliced))
+            last_slice = current_slice
+    else:
+        end = duration
+        timestamps = [token for token in tokens if token >= timestamp_begin]
+        if timestamps and timestamps[-1] != timestamp_begin:
+            end = (timestamps[-1] - timestamp_begin) * time_precision
+        spans.append((0.0, end, tokens))
+    starts, ends, texts, raw_texts = [], [], [], []
+    for start, end, sliced in spans:
+        raw = tokenizer.decode([token for token in sliced if token < tokenizer.eot])
+        # Like transcribe(), drop instantaneous or empty segments
+        if start == end or not raw.strip():
+            continue
+        starts.append(start)
+        ends.append(end)
+        texts.append(raw.strip())
+        raw_texts.append(raw)
+    return Transcript(
+        starts=starts, ends=ends, texts=texts, full_text="".join(raw_texts).strip()
+    )
+
+
 # Whisper backend implementation
+# Loaded models shared by every backend instance, keyed by model name
+_MODEL_CACHE: Dict[str, Any] = {}
+# Defaults of whisper's transcribe(), applied to batched decodes too
+_NO_SPEECH_THRESHOLD = 0.6
+_LOGPROB_THRESHOLD = -1.0
+_COMPRESSION_RATIO_THRESHOLD = 2.4
+
+
 class WhisperBackend:
     def __init__(self, model_name: str = "base"):
         self.model_name = model_name
@@ -49,49 +160,211 @@ class WhisperBackend:
         self._logger = logging.getLogger(__name__)
 
     def _lazy_load_model(self):
+        if self._model is None:
+            self._model = _MODEL_CACHE.get(self.model_name)
         if self._model is None:
             try:
                 import whisper
 
                 self._logger.info(f"Loading Whisper model '{self.model_name}'...")
-                self._model = whisper.load_model(self.model_name)
+                self._model = _MODEL_CACHE[self.model_name] = whisper.load_model(
+                    self.model_name
+                )
                 self._logger.info("Whisper model loaded.")
             except Exception as e:
                 self._logger.error("Failed to load Whisper model.", exc_info=True)
                 raise ModelLoadError(str(e)) from e
 
-    def _convert_audio(self, audio_path: Path) -> Path:
+    def _transcribe_input(self, audio) -> Transcript:
+        # `audio` is a file path or an already decoded 16 kHz waveform
+        result = self._model.transcribe(audio)
+        segments = result.get("segments", [])
+        count = len(segments)
+        return Transcript(
+            starts=np.fromiter(
+                (seg["start"] for seg in segments), dtype=np.float64, count=count
+            ),
+            ends=np.fromiter(
+                (seg["end"] for seg in segments), dtype=np.float64, count=count
+            ),
+            texts=[seg["text"].strip() for seg in segments],
+            full_text=result.get("text", "").strip(),
+        )
+
+    def transcribe(self, audio_path: Path) -> Transcript:
+        _check_audio(audio_path)
+        self._lazy_load_model()
         try:
-            from pydub import AudioSegment
-
-            self._logger.debug(f"Checking audio format for {audio_path}")
-            if audio_path.suffix.lower() != ".wav":
-                self._logger.info(f"Converting {audio_path} to WAV format...")
-                audio = AudioSegment.from_file(audio_path)
-                wav_path = audio_path.with_suffix(".wav")
-                audio.export(wav_path, format="wav")
-                self._logger.info(f"Audio converted to {wav_path}")
-                return wav_path
-            return audio_path
+            self._logger.info(f"Transcribing {audio_path} with Whisper...")
+            transcript = self._transcribe_input(str(audio_path))
+            self._logger.info("Transcription complete.")
+            return transcript
         except Exception as e:
-            self._logger.error("Audio format conversion failed.", exc_info=True)
-            raise AudioFormatError(str(e)) from e
+            self._logger.error("Transcription failed.", exc_info=True)
+            raise BackendError(str(e)) from e
 
-    def transcribe(self, audio_path: Path) -> Transcript:
+    def _batch_result_to_transcript(self, audio, result) -> Transcript:
+        import whisper
+
+        # Same silence and fallback rules as whisper's transcribe defaults:
+        # silence is skipped unless the decode is confident (logprob > -1.0)
+        if (
+            result.no_speech_prob > _NO_SPEECH_THRESHOLD
+            and result.avg_logprob <= _LOGPROB_THRESHOLD
+        ):
+            return Transcript()
+        needs_fallback = (
+            result.compression_ratio > _COMPRESSION_RATIO_THRESHOLD
+            or result.avg_logprob < _LOGPROB_THRESHOLD
+        )
+        if needs_fallback:
+            return self._transcribe_input(audio)
+        tokenizer = whisper.tokenizer.get_tokenizer(
+            self._model.is_multilingual,
+            num_languages=self._model.num_languages,
+            language=result.language,
+            task="transcribe",
+        )
+        input_stride = whisper.audio.N_FRAMES // self._model.dims.n_audio_ctx
+        return _split_timestamped(
+            result.tokens,
+            tokenizer,
+            duration=len(audio) / whisper.audio.SAMPLE_RATE,
+            time_precision=input_stride
+            * whisper.audio.HOP_LENGTH
+            / whisper.audio.SAMPLE_RATE,
+        )
+
+    def transcribe_batch(
+        self, audio_paths: List[Path], batch_size: int = 8
+    ) -> List[Transcript]:
+        """Transcribe several files, decoding clips of up to 30s together.
+
+        Short clips share one padded mel batch per greedy encoder/decoder call
+        and are split into segments at the decoded timestamps; longer files are
+        transcribed one by one. Clips that fail the same quality checks as
+        ``transcribe`` are re-run through it to get its temperature fallback.
+        """
+        for audio_path in audio_paths:
+            _check_audio(audio_path)
         self._lazy_load_model()
-        wav_path = self._convert_audio(audio_path)
         try:
-            self._logger.info(f"Transcribing {wav_path} with Whisper...")
-            result = self._model.transcribe(str(wav_path))
-            segments = [
-                TranscriptSegment(
-                    start=seg["start"], end=seg["end"], text=seg["text"].strip()
+            import torch
+            import whisper
+
+            transcripts: List[Optional[Transcript]] = [None] * len(audio_paths)
+            short_clips = []  # (index, samples)
+            for i, audio_path in enumerate(audio_paths):
+                audio = whisper.load_audio(str(audio_path))
+                if len(audio) <= whisper.audio.N_SAMPLES:
+                    short_clips.append((i, audio))
+                else:
+                    transcripts[i] = self._transcribe_input(audio)
+            options = whisper.DecodingOptions(fp16=self._model.device.type == "cuda")
+            for offset in range(0, len(short_clips), batch_size):
+                batch = short_clips[offset : offset + batch_size]
+                self._logger.info(f"Transcribing batch of {len(batch)} clips...")
+                mel = torch.stack(
+                    [
+                        whisper.log_mel_spectrogram(
+                            whisper.pad_or_trim(audio), self._model.dims.n_mels
+                        )
+                        for _, audio in batch
+                    ]
+                ).to(self._model.device)
+                results = whisper.decode(self._model, mel, options)
+                for (i, audio), result in zip(batch, results):
+                    transcripts[i] = self._batch_result_to_transcript(audio, result)
+            self._logger.info("Batch transcription complete.")
+            return transcripts
+        except Exception as e:
+            self._logger.error("Batch transcription failed.", exc_info=True)
+            raise BackendError(str(e)) from e
+
+
+# faster-whisper (CTranslate2) backend implementation
+# Loaded models shared by every backend instance, keyed by
+# (model name, device, compute type)
+_FASTER_MODEL_CACHE: Dict[Tuple[str, str, str], Any] = {}
+
+
+class FasterWhisperBackend:
+    def __init__(
+        self,
+        model_name: str = "base",
+        device: str = "auto",
+        compute_type: Optional[str] = None,
+        vad_filter: bool = True,
+    ):
+        self.model_name = model_name
+        self.device = device
+        # None picks float16 on CUDA and int8 on CPU
+        self.compute_type = compute_type
+        self.vad_filter = vad_filter
+        self._model = None
+        self._logger = logging.getLogger(__name__)
+
+    def _resolve_device(self) -> str:
+        if self.device != "auto":
+            return self.device
+        import ctranslate2
+
+        return "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+
+    def _lazy_load_model(self):
+        if self._model is not None:
+            return
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError as e:
+            raise ModelLoadError(
+                "Please install faster-whisper: "
+                "pip install meetingminds[faster-whisper]"
+            ) from e
+        try:
+            device = self._resolve_device()
+            compute_type = self.compute_type or (
+                "float16" if device == "cuda" else "int8"
+            )
+            key = (self.model_name, device, compute_type)
+            self._model = _FASTER_MODEL_CACHE.get(key)
+            if self._model is None:
+                self._logger.info(
+                    f"Loading faster-whisper model '{self.model_name}' "
+                    f"on {device} ({compute_type})..."
+                )
+                self._model = _FASTER_MODEL_CACHE[key] = WhisperModel(
+                    self.model_name, device=device, compute_type=compute_type
                 )
-                for seg in result.get("segments", [])
-            ]
-            full_text = result.get("text", "").strip()
+                self._logger.info("faster-whisper model loaded.")
+        except Exception as e:
+            self._logger.error("Failed to load faster-whisper model.", exc_info=True)
+            raise ModelLoadError(str(e)) from e
+
+    def transcribe(self, audio_path: Path) -> Transcript:
+        _check_audio(audio_path)
+        self._lazy_load_model()
+        try:
+            self._logger.info(f"Transcribing {audio_path} with faster-whisper...")
+            # faster-whisper decodes any ffmpeg-readable format itself
+            result, _ = self._model.transcribe(
+                str(audio_path), vad_filter=self.vad_filter
+            )
+            segments = list(result)  # Decoding runs lazily while iterating
+            count = len(segments)
+            texts = [seg.text.strip() for seg in segments]
+            full_text = " ".join(text for text in texts if text)
             self._logger.info("Transcription complete.")
-            return Transcript(segments=segments, full_text=full_text)
+            return Transcript(
+                starts=np.fromiter(
+                    (seg.start for seg in segments), dtype=np.float64, count=count
+                ),
+                ends=np.fromiter(
+                    (seg.end for seg in segments), dtype=np.float64, count=count
+                ),
+                texts=texts,
+                full_text=full_text,
+            )
         except Exception as e:
             self._logger.error("Transcription failed.", exc_info=True)
             raise BackendError(str(e)) from e
@@ -101,6 +374,8 @@ class WhisperBackend:
 def get_backend(name: str, **kwargs) -> TranscriptionBackend:
     if name.lower() == "whisper":
         return WhisperBackend(**kwargs)
+    if name.lower() == "faster-whisper":
+        return FasterWhisperBackend(**kwargs)
     raise ValueError(f"Unknown backend: {name}")
 
 
@@ -115,3 +390,11 @@ class Transcriber:
         path = Path(audio_path)
         self._logger.info(f"Starting transcription for {path}")
         return self.backend.transcribe(path)
+
+    def transcribe_batch(self, audio_paths: List[str | Path]) -> List[Transcript]:
+        paths = [Path(audio_path) for audio_path in audio_paths]
+        self._logger.info(f"Starting batch transcription for {len(paths)} files")
+        transcribe_batch = getattr(self.backend, "transcribe_batch", None)
+        if transcribe_batch is not None:
+            return transcribe_batch(paths)
+        return [self.backend.transcribe(path) for path in paths]